@@ -14,14 +14,33 @@ void generate_random_input_space(int (&input_space)[ROWS][COLS]) {
   }
 }
 
+// prefix[i][j] holds the number of non-zero cells in input_space[0..i)[0..j),
+// so the count for any tile is four lookups instead of a scan over its pixels
+void build_prefix_sum(const int (&input_space)[ROWS][COLS],
+                      int (&prefix)[ROWS + 1][COLS + 1]) {
+  for (int j = 0; j <= COLS; ++j)
+    prefix[0][j] = 0;
+  for (int i = 0; i < ROWS; ++i) {
+    prefix[i + 1][0] = 0;
+    for (int j = 0; j < COLS; ++j) {
+      prefix[i + 1][j + 1] = prefix[i][j + 1] + prefix[i + 1][j] -
+                             prefix[i][j] + (input_space[i][j] != 0);
+    }
+  }
+}
+
 int main() {
   std::cout << "Tile selection module" << std::endl;
 
   int input_space[ROWS][COLS] = {0};
   generate_random_input_space(input_space);
 
-  std::vector<std::vector<TileInfo>> tiles(
-      TILES_X, std::vector<TileInfo>(TILES_Y, {false, 0, 0}));
+  int prefix[ROWS + 1][COLS + 1];
+  build_prefix_sum(input_space, prefix);
+
+  // tile grid stored row-major in one contiguous buffer, indexed
+  // tx * TILES_Y + ty
+  std::vector<TileInfo> tiles(TILES_X * TILES_Y, {false, 0, 0});
 
   for (int tx = 0; tx < TILES_X; ++tx) {
     for (int ty = 0; ty < TILES_Y; ++ty) {
@@ -31,28 +50,21 @@ int main() {
       int end_x = std::min(start_x + TILE_HEIGHT, ROWS);
       int end_y = std::min(start_y + TILE_WIDTH, COLS);
 
-      int non_empty = 0;
-      int empty = 0;
-
-      for (int i = start_x; i < end_x; ++i) {
-        for (int j = start_y; j < end_y; ++j) {
-          if (input_space[i][j] != 0)
-            ++non_empty;
-          else
-            ++empty;
-        }
-      }
+      int non_empty = prefix[end_x][end_y] - prefix[start_x][end_y] -
+                      prefix[end_x][start_y] + prefix[start_x][start_y];
+      int empty = (end_x - start_x) * (end_y - start_y) - non_empty;
 
-      tiles[tx][ty].non_empty = non_empty;
-      tiles[tx][ty].empty = empty;
-      tiles[tx][ty].active = (non_empty > 0);
+      TileInfo &t = tiles[tx * TILES_Y + ty];
+      t.non_empty = non_empty;
+      t.empty = empty;
+      t.active = (non_empty > 0);
     }
   }
 
   std::cout << "\nTile statistics (active tiles and pixel counts):\n";
   for (int tx = 0; tx < TILES_X; ++tx) {
     for (int ty = 0; ty < TILES_Y; ++ty) {
-      const auto &t = tiles[tx][ty];
+      const auto &t = tiles[tx * TILES_Y + ty];
       if (t.active) {
         std::cout << "Tile (" << tx << ", " << ty << ") "
                   << "non-empty: " << t.non_empty << ", empty: " << t.empty